@@ -1,8 +1,7 @@
 """app.py"""
 
 from __future__ import annotations
-from typing import Any, Hashable
-import json
+from typing import Any, Callable, Hashable
 import os
 import sys
 import pathlib
@@ -12,8 +11,12 @@ from dash import Input, Output, State, html, dcc
 import dash_bootstrap_components as dbc
 from dash_bootstrap_templates import load_figure_template
 from dotenv import load_dotenv
+from flask import Response, abort
+import orjson
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
+import pyarrow.parquet as pq
 from utils import (
     generate_threat_risk_score_graph, generate_threat_priorites_graph,
     generate_threat_source_graph, generate_threat_destination_graph,
@@ -37,6 +40,9 @@ except KeyError as err:
 # Define APP_PATH as the absolute path of the directory containing this script.
 APP_PATH = str(pathlib.Path(__file__).parent.resolve())
 
+# Serialize figures and callback responses with orjson
+pio.json.config.default_engine = "orjson"
+
 # Application setup
 load_figure_template("darkly")
 app = dash.Dash(
@@ -54,13 +60,64 @@ server = app.server
 app.config["suppress_callback_exceptions"] = True
 PLOTLY_LOGO = r"assets/plotly_logo.png"
 
-# Dashboard date range
+# Figure generators by graph id. The generators cache their figures and
+#  rebuild them when their data changes, so only the JSON is cached here.
+FIGURES = {
+    "trs-graph": generate_threat_risk_score_graph,
+    "tp-graph": generate_threat_priorites_graph,
+    "ts-graph": generate_threat_source_graph,
+    "td-graph": generate_threat_destination_graph,
+    "atot-graph": generate_aware_threats_over_time_graph,
+    "tl-map": generate_threat_locations_map,
+}
+figure_cache: dict[str, tuple[go.Figure, str]] = {}
+
+
+def cached_figure(name: str) -> str:
+    """Returns the serialized JSON of a figure, serializing it only on
+    first use or when its generator returns a rebuilt figure.
+
+    Args:
+        name (str): The graph id of the figure.
+
+    Returns:
+        The figure serialized as a JSON string.
+    """
+    figure = FIGURES[name]()
+    cached = figure_cache.get(name)
+    if cached is None or cached[0] is not figure:
+        cached = (figure, figure.to_json(validate=False))
+        figure_cache[name] = cached
+    return cached[1]
+
+
+@server.route("/_fig/<name>")
+def figure_json(name: str) -> Response:
+    """Serves the cached JSON of a figure by its graph id.
+
+    Args:
+        name (str): The graph id of the figure.
+
+    Returns:
+        A JSON response containing the serialized figure.
+    """
+    if name not in FIGURES:
+        abort(404)
+    return Response(cached_figure(name), mimetype="application/json")
+
+
+# Dashboard date range, read from the event data statistics
 try:
-    with open(f"{APP_PATH}/data/events.json", encoding="utf-8") as events:
-        json_data = json.load(events)
-        start_date, end_date = json_data["AWARE Threats"]["Date"][
-            0], json_data["AWARE Threats"]["Date"][-1]
-except (FileNotFoundError, KeyError):
+    metadata = pq.read_metadata(f"{APP_PATH}/data/events.parquet")
+    column = metadata.schema.names.index("Date/Time")
+    stats = [
+        metadata.row_group(i).column(column).statistics
+        for i in range(metadata.num_row_groups)
+    ]
+    stats = [s for s in stats if s is not None and s.has_min_max]
+    start_date = min(s.min for s in stats).strftime("%Y-%m-%d %p")
+    end_date = max(s.max for s in stats).strftime("%Y-%m-%d %p")
+except (FileNotFoundError, ValueError):
     start_date, end_date = "-", "-"
 
 # Navbar Links
@@ -142,7 +199,7 @@ threat_risk_score_graph = html.Div(
                     "paddingLeft": "20px",
                     "paddingTop": "5px"
                 }),
-        dcc.Graph(id="trs-graph", figure=generate_threat_risk_score_graph()),
+        dcc.Graph(id="trs-graph"),
     ],
     style={
         "marginBottom": "30px",
@@ -158,7 +215,7 @@ threat_priorities_graph = html.Div(
                     "paddingLeft": "20px",
                     "paddingTop": "5px"
                 }),
-        dcc.Graph(id="tp-graph", figure=generate_threat_priorites_graph()),
+        dcc.Graph(id="tp-graph"),
     ],
     style={
         "marginBottom": "30px",
@@ -174,7 +231,7 @@ threat_source_graph = html.Div(
                     "paddingLeft": "20px",
                     "paddingTop": "5px"
                 }),
-        dcc.Graph(id="ts-graph", figure=generate_threat_source_graph()),
+        dcc.Graph(id="ts-graph"),
     ],
     style={
         "marginBottom": "30px",
@@ -190,7 +247,7 @@ threat_destination_graph = html.Div(
                     "paddingLeft": "20px",
                     "paddingTop": "5px"
                 }),
-        dcc.Graph(id="td-graph", figure=generate_threat_destination_graph()),
+        dcc.Graph(id="td-graph"),
     ],
     style={
         "marginBottom": "30px",
@@ -206,8 +263,7 @@ aware_threats_over_time_graph = html.Div(
                     "paddingLeft": "20px",
                     "paddingTop": "5px"
                 }),
-        dcc.Graph(id="atot-graph",
-                  figure=generate_aware_threats_over_time_graph()),
+        dcc.Graph(id="atot-graph"),
     ],
     style={
         "marginBottom": "30px",
@@ -222,7 +278,7 @@ threat_locations_map = html.Div(
                     "paddingLeft": "20px",
                     "paddingTop": "5px"
                 }),
-        dcc.Graph(id="tl-map", figure=generate_threat_locations_map()),
+        dcc.Graph(id="tl-map"),
     ],
     style={
         "marginBottom": "30px",
@@ -336,6 +392,29 @@ vis_5 = html.Div(dbc.Container(
 # Callbacks
 
 
+def figure_loader(name: str) -> Callable[[str], dict[str, Any]]:
+    """Makes a callback that fills an empty graph with its cached figure,
+    so the page layout is served before any figure is serialized.
+
+    Args:
+        name (str): The graph id of the figure.
+
+    Returns:
+        A callback function returning the figure of the graph.
+    """
+
+    def load_figure(_: str) -> dict[str, Any]:
+        return orjson.loads(cached_figure(name))
+
+    return load_figure
+
+
+# Load each figure once its empty graph is on the page
+for graph_id in FIGURES:
+    app.callback(Output(graph_id, "figure"),
+                 Input(graph_id, "id"))(figure_loader(graph_id))
+
+
 @app.callback(  # type: ignore
     Output("navbar-collapse", "is_open"),
     [Input("navbar-toggler", "n_clicks")],
@@ -0,0 +1,127 @@
+"""_validate.py"""
+
+import numpy as np
+
+# Number of commas in a complete 20 column log line
+COMMAS = 19
+
+try:
+    import numba as nb
+
+    # Log buffers are read-only memory maps
+    _BUF = nb.types.Array(nb.uint8, 1, "C", readonly=True)
+
+    @nb.njit(nb.bool_[:](_BUF, nb.int64[:], nb.int64[:]),
+             cache=True,
+             boundscheck=False)
+    def valid_mask(buf: np.ndarray, starts: np.ndarray,
+                   ends: np.ndarray) -> np.ndarray:
+        """Flag lines of a byte buffer that contain 20 columns of data.
+
+        Args:
+            buf (np.ndarray): Raw log bytes as a uint8 array.
+            starts (np.ndarray): Offset of the first byte of each line.
+            ends (np.ndarray): Offset of the newline ending each line.
+
+        Returns:
+            Boolean array, True for each complete line.
+        """
+        out = np.empty(starts.size, np.bool_)
+        for i in range(starts.size):
+            c = 0
+            for j in range(starts[i], ends[i] + 1):
+                if buf[j] == 44:
+                    c += 1
+            out[i] = c == COMMAS
+        return out
+
+    @nb.njit(nb.bool_[:](_BUF, nb.int64[:], nb.int64[:], nb.int64),
+             cache=True,
+             boundscheck=False)
+    def true_mask(buf: np.ndarray, starts: np.ndarray, ends: np.ndarray,
+                  field: int) -> np.ndarray:
+        """Flag lines of a byte buffer whose column is a true boolean,
+        i.e. "1" or any casing of "true", without parsing the line.
+
+        Args:
+            buf (np.ndarray): Raw log bytes as a uint8 array.
+            starts (np.ndarray): Offset of the first byte of each line.
+            ends (np.ndarray): Offset of the newline ending each line.
+            field (int): Index of the column to test.
+
+        Returns:
+            Boolean array, True for each line with a true column value.
+        """
+        out = np.zeros(starts.size, np.bool_)
+        for i in range(starts.size):
+            j = starts[i]
+            c = 0
+            while j <= ends[i] and c < field:
+                if buf[j] == 44:
+                    c += 1
+                j += 1
+            k = j
+            while k <= ends[i] and buf[k] != 44 and buf[k] != 10:
+                k += 1
+            if k - j == 4:
+                out[i] = ((buf[j] | 32) == 116 and (buf[j + 1] | 32) == 114
+                          and (buf[j + 2] | 32) == 117
+                          and (buf[j + 3] | 32) == 101)
+            elif k - j == 1:
+                out[i] = buf[j] == 49
+        return out
+
+except ImportError:
+
+    def valid_mask(buf: np.ndarray, starts: np.ndarray,
+                   ends: np.ndarray) -> np.ndarray:
+        """Flag lines of a byte buffer that contain 20 columns of data.
+
+        Numba is not installed, so commas are counted with a vectorized
+        NumPy reduction. Lines must be contiguous and cover the buffer.
+
+        Args:
+            buf (np.ndarray): Raw log bytes as a uint8 array.
+            starts (np.ndarray): Offset of the first byte of each line.
+            ends (np.ndarray): Offset of the newline ending each line.
+
+        Returns:
+            Boolean array, True for each complete line.
+        """
+        commas = np.add.reduceat(buf[:ends[-1] + 1] == 0x2C,
+                                 starts,
+                                 dtype=np.int64)
+        return commas == COMMAS
+
+    def true_mask(buf: np.ndarray, starts: np.ndarray, ends: np.ndarray,
+                  field: int) -> np.ndarray:
+        """Flag lines of a byte buffer whose column is a true boolean,
+        i.e. "1" or any casing of "true", without parsing the line.
+
+        Numba is not installed, so columns are located through the sorted
+        comma offsets. Lines must contain more than field commas.
+
+        Args:
+            buf (np.ndarray): Raw log bytes as a uint8 array.
+            starts (np.ndarray): Offset of the first byte of each line.
+            ends (np.ndarray): Offset of the newline ending each line.
+            field (int): Index of the column to test.
+
+        Returns:
+            Boolean array, True for each line with a true column value.
+        """
+        out = np.zeros(starts.size, np.bool_)
+        if not starts.size:
+            return out
+        commas = np.flatnonzero(buf[:ends[-1] + 1] == 0x2C)
+        first = np.searchsorted(commas, starts)
+        begin = commas[first + field - 1] + 1 if field else starts
+        size = commas[first + field] - begin
+
+        # Compare the lowercased bytes of four character values
+        word = np.flatnonzero(size == 4)
+        lower = buf[begin[word, None] + np.arange(4)] | 32
+        out[word] = (lower == np.frombuffer(b"true", np.uint8)).all(axis=1)
+        digit = np.flatnonzero(size == 1)
+        out[digit] = buf[begin[digit]] == 0x31
+        return out
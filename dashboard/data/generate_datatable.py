@@ -1,52 +1,92 @@
 """generate_datatable.py"""
 
-import re
+from __future__ import annotations
+from typing import Any, Iterator
+import io
+import os
+import itertools
 import sys
-import subprocess
+import mmap
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from _validate import valid_mask, true_mask
 
 LOGS = "/var/log/fwd/db/"
 PREFIX = "fwddmp.log.tmp"
+DATE_FORMAT = "%Y/%m/%d %H:%M:%S"
 
 # Get/set current dates
 today = datetime.now().strftime("_%m_%d_")
-old = (datetime.now() - timedelta(days=10)).strftime("%Y/%m/%d %H:%M:%S")
+old = (datetime.now() - timedelta(days=10)).replace(microsecond=0)
 
 # Define file paths
 log_path = Path(LOGS)
 data_path = Path(__file__).resolve().parent
 
 # Define the columns based on the structure of the log
+raw_columns = [
+    "ID", "Priority", "Type", "Event Description", "Date/Time", "Protocol",
+    "Source IP Address", "Source Port", "Source URL", "Source MAC Address",
+    "Internal Source", "Blocked Source", "Destination IP Address",
+    "Destination Port", "Destination URL", "Destination MAC Address",
+    "Internal Destination", "Blocked Destination", "Bad Host", "Good Host"
+]
+blocked_field = raw_columns.index("Blocked Source")
+
+# Define the columns used by the dashboard
 columns = [
     "Date/Time", "Source IP Address", "Destination IP Address",
     "Event Description", "Priority"
 ]
 
-# Set column dtypes
-dtypes = {
-    "ID": str,
-    "Priority": int,
-    "Type": str,
-    "Event Description": str,
-    "Date/Time": str,
-    "Protocol": str,
-    "Source IP Address": str,
-    "Source Port": int,
-    "Source URL": str,
-    "Source MAC Address": str,
-    "Internal Source": str,
-    "Blocked Source": bool,
-    "Destination IP Address": str,
-    "Destination Port": int,
-    "Destination URL": str,
-    "Destination MAC Address": str,
-    "Internal Destination": int,
-    "Blocked Destination": int,
-    "Good Host": int,
-    "Bad Host": int
-}
+# Low cardinality event data columns to dictionary encode
+category_columns = [
+    "Source IP Address", "Destination IP Address", "Event Description"
+]
+
+# Set arrow schema of the event data
+schema = pa.schema([
+    ("Date/Time", pa.timestamp("ns")),
+    ("Source IP Address", pa.string()),
+    ("Destination IP Address", pa.string()),
+    ("Event Description", pa.string()),
+    ("Priority", pa.int32()),
+])
+
+# Set arrow csv options for the event data columns
+read_options = pacsv.ReadOptions(column_names=columns, block_size=1 << 22)
+parse_options = pacsv.ParseOptions(invalid_row_handler=lambda row: "skip")
+category_options = pacsv.ConvertOptions(
+    column_types={
+        field.name: (pa.dictionary(pa.int32(), field.type)
+                     if field.name in category_columns else field.type)
+        for field in schema
+    },
+    timestamp_parsers=[DATE_FORMAT])
+# Arrow quotes every string unless quoting is off, so write unquoted as
+# pandas did and only quote batches with values that require it
+write_options = pacsv.WriteOptions(include_header=False,
+                                   quoting_style="none")
+quoted_write_options = pacsv.WriteOptions(include_header=False,
+                                          quoting_style="needed")
+
+# Set arrow csv options for the raw log columns used by the dashboard
+raw_read_options = pacsv.ReadOptions(column_names=raw_columns,
+                                     block_size=1 << 22)
+raw_convert_options = pacsv.ConvertOptions(
+    column_types={
+        **category_options.column_types,
+        "Date/Time": pa.string(),
+        "Blocked Source": pa.bool_()
+    },
+    include_columns=columns + ["Blocked Source"])
 
 
 def get_logs() -> list[Path]:
@@ -69,192 +109,357 @@ def get_logs() -> list[Path]:
     return files_to_process
 
 
-def clean_logs(files: list[Path]) -> list[Path]:
-    """Copy data do application data directory and strip csv
-    files of any lines that do not contain 20 columns of data,
-    as those lines are incomplete writes.
+def iter_valid_lines(file: Path) -> Iterator[bytes]:
+    """Yield the lines of a log file that contain 20 columns of data and
+    a blocked source, skipping incomplete writes and unblocked events
+    before they are parsed.
 
     Args:
-        files (list[Path]): List of filename paths to be processed.
+        file (Path): Log filename path to be read.
 
-    Returns:
-        List of copied and cleaned filename paths.
+    Yields:
+        Raw bytes of each complete, blocked event line. Nothing is yielded
+          for a log file without blocked events, so callers must handle
+          an empty stream.
+    """
+    if file.stat().st_size == 0:
+        return
+
+    # Scan the memory mapped log in one vectorized pass
+    with open(file, "rb") as f, mmap.mmap(f.fileno(), 0,
+                                          access=mmap.ACCESS_READ) as mm:
+        arr = np.frombuffer(mm, dtype=np.uint8)
+
+        # Locate line boundaries, keeping a trailing partial line
+        ends = np.flatnonzero(arr == 0x0A)
+        if arr[-1] != 0x0A:
+            ends = np.append(ends, arr.size - 1)
+        starts = np.concatenate(([0], ends[:-1] + 1))
+
+        # Keep lines with 19 commas, i.e. 20 columns
+        mask = valid_mask(arr, starts, ends)
+        starts, ends = starts[mask], ends[mask]
+
+        # Keep lines with a true "Blocked Source" column
+        mask = true_mask(arr, starts, ends, blocked_field)
+        del arr
+        for start, end in zip(starts[mask].tolist(), ends[mask].tolist()):
+            yield mm[start:end + 1]
+
+
+class LineStream(io.RawIOBase):
+    """Read-only binary file object over an iterator of byte strings, so
+    lines can be parsed as they are produced without a temporary file.
+
+    Args:
+        lines (Iterator[bytes]): Byte strings to be read in order.
     """
 
-    # Remove any lines from log files that are missing data columns
-    #  and copy them to are dashboard data directory
-    new_files = []
-    for file in files:
-        new_file = data_path / file.name
-        command = f"awk -F, 'NF == 20' {str(file)} > {str(new_file)}"
-        process = subprocess.run(command, shell=True, check=True, text=True)
-        if process.returncode != 0:
-            print("Error occurred during filtering.")
-            sys.exit(1)
-        new_files.append(new_file)
-    return new_files
+    def __init__(self, lines: Iterator[bytes]) -> None:
+        self._lines = lines
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._pending:
+            try:
+                self._pending = memoryview(next(self._lines))
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
 
 
 def clean_csv(in_file: Path, out_file: Path) -> None:
     """Remove duplicates, sort by Date/Time decending, save to a new
-    csv file, and delete original csv file.
+    arrow IPC file, and delete original csv file.
 
     Args:
         in_file (Path): Csv filename path to process.
-        out_file (Path): Csv filename path of output file.
+        out_file (Path): Arrow IPC filename path of output file.
 
     Returns:
         None
     """
-    # Read the dirty file into a DataFrame
+    # Read the dirty file into an arrow Table
     try:
-        df = pd.read_csv(in_file,
-                         header=None,
-                         encoding="utf-8",
-                         names=columns,
-                         dtype=dtypes)
+        table = pacsv.read_csv(in_file,
+                               read_options=read_options,
+                               parse_options=parse_options,
+                               convert_options=category_options)
     except FileNotFoundError:
         sys.exit(0)
 
     # Delete dirty file
     in_file.unlink(missing_ok=True)
 
-    # Remove duplicates
-    df_dropped = df.drop_duplicates()
-    del df
+    # Remove duplicates on the dictionary codes
+    table_dropped = table.unify_dictionaries().group_by(columns).aggregate([])
+    del table
 
     # Sort by Date/Time
-    df_sorted = df_dropped.sort_values(by='Date/Time', ascending=False)
-    del df_dropped
+    table_sorted = table_dropped.sort_by([("Date/Time", "descending")])
+    del table_dropped
 
     # Write new clean file
-    out_file.unlink(missing_ok=True)
-    df_sorted.to_csv(out_file, index=False, header=False, encoding="utf-8")
+    with pa.ipc.new_file(out_file, schema) as writer:
+        writer.write_table(table_sorted.cast(schema))
+
+
+def write_unique(writer: pq.ParquetWriter, table: pa.Table,
+                 seen: set[int]) -> None:
+    """Write the rows of a table that have not been written yet, tracked
+    by their 64-bit row hash.
+
+    Args:
+        writer (pq.ParquetWriter): Writer of the event data file.
+        table (pa.Table): Event data rows to write.
+        seen (set[int]): Row hashes already written, updated in place.
+
+    Returns:
+        None
+    """
+    hashes = pd.util.hash_pandas_object(table.to_pandas(), index=False)
+    keep = ~(hashes.duplicated() | hashes.isin(seen))
+    if not keep.any():
+        return
+    seen.update(hashes[keep].tolist())
+    writer.write_table(table.filter(pa.array(keep.to_numpy())))
 
 
 def purge_old_and_update(in_file: Path, out_file: Path) -> None:
-    """Purge old events and update with new.
+    """Purge old events and merge in new, keeping the event data sorted
+    by Date/Time decending, then export a csv copy of the event data for
+    debugging.
+
+    Both the existing event data and the new data are sorted decending,
+    so they are merged in a single streaming pass over the existing row
+    groups, each written along with the new events that sort into it.
 
     Args:
-        in_file (Path): Csv filename path of new data.
-        out_file (Path): Csv filename path to purge/update.
+        in_file (Path): Arrow IPC filename path of new data.
+        out_file (Path): Parquet filename path to purge/update.
 
     Returns:
         None
     """
-    new_temp_file = Path(data_path / "new_temp.csv")
-
-    # Read existing csv file into a DataFrame
-    if out_file.is_file():
-        df = pd.read_csv(out_file,
-                         header=None,
-                         names=columns,
-                         chunksize=50000,
-                         encoding="utf-8",
-                         dtype=dtypes,
-                         on_bad_lines="skip")
-
-        # Process in 50,000 line chunks
-        # Purge old events
-        for chunk in df:
-            df_purged = chunk[chunk["Date/Time"] > old]
-            del chunk
-            df_purged.to_csv(new_temp_file,
-                             mode="a",
-                             index=False,
-                             header=False,
-                             encoding="utf-8")
-            del df_purged
-        out_file.unlink()
-        new_temp_file.rename(out_file)
-
-    # Read new data csv file into a DateFrame
+    new_temp_file = Path(data_path / "new_temp.parquet")
+
+    # Memory map new data arrow file into an arrow Table
     try:
-        df_final = pd.read_csv(in_file,
-                               header=None,
-                               names=columns,
-                               encoding="utf-8",
-                               dtype=dtypes,
-                               on_bad_lines="skip")
+        source = pa.memory_map(str(in_file))
+        table_final = pa.ipc.open_file(source).read_all()
     except FileNotFoundError:
-        sys.exit(0)
-
-    # Append new data to existing csv event data file
-    if not df_final.empty:
-        df_final.to_csv(out_file,
-                        mode="a",
-                        index=False,
-                        header=False,
-                        encoding="utf-8")
-    del df_final
+        source = None
+        table_final = schema.empty_table()
+
+    # Ascending new event dates to binary search for merge positions
+    new_dates = table_final["Date/Time"].to_numpy()[::-1]
+    merged = 0
+
+    seen: set[int] = set()
+    with pq.ParquetWriter(new_temp_file, schema,
+                          compression="snappy") as writer:
+
+        # Stream existing events, skipping row groups that are all old
+        if out_file.is_file():
+            parquet_file = pq.ParquetFile(out_file)
+            metadata = parquet_file.metadata
+            column = parquet_file.schema_arrow.get_field_index("Date/Time")
+            for i in range(metadata.num_row_groups):
+                stats = metadata.row_group(i).column(column).statistics
+                if stats and stats.has_min_max and stats.max <= old:
+                    continue
+
+                # Purge old events
+                table = parquet_file.read_row_group(i)
+                table = table.filter(pc.greater(table["Date/Time"], old))
+                if not table.num_rows:
+                    continue
+
+                # Merge in new events not older than the oldest kept event
+                end = new_dates.size - np.searchsorted(
+                    new_dates, table["Date/Time"].to_numpy()[-1])
+                if end > merged:
+                    table = pa.concat_tables([
+                        table,
+                        table_final.slice(merged, end - merged)
+                    ]).sort_by([("Date/Time", "descending")])
+                    merged = end
+                write_unique(writer, table, seen)
+                del table
+
+        # Write remaining new events, older than all existing events
+        if merged < table_final.num_rows:
+            write_unique(writer, table_final.slice(merged), seen)
+        del table_final
+    if source is not None:
+        source.close()
+    new_temp_file.replace(out_file)
+
+    # Export the event data to csv, formatting dates as in the logs
+    csv_schema = schema.set(0, pa.field("Date/Time", pa.string()))
+    with open(out_file.with_suffix(".csv"), "wb") as csv_file:
+        for batch in pq.ParquetFile(out_file).iter_batches():
+            dates = pc.strftime(pc.cast(batch["Date/Time"],
+                                        pa.timestamp("s"),
+                                        safe=False),
+                                format=DATE_FORMAT)
+            batch = pa.RecordBatch.from_arrays([dates, *batch.columns[1:]],
+                                               schema=csv_schema)
+            buffer = pa.BufferOutputStream()
+            try:
+                pacsv.write_csv(batch, buffer, write_options=write_options)
+            except pa.ArrowInvalid:
+                buffer = pa.BufferOutputStream()
+                pacsv.write_csv(batch,
+                                buffer,
+                                write_options=quoted_write_options)
+            csv_file.write(buffer.getvalue())
 
     # Delete temp temp file
     in_file.unlink(missing_ok=True)
 
 
+def process_one(file: Path) -> Path | None:
+    """Clean the blocked events of a log file into a duplicate free
+    arrow IPC file sorted by Date/Time decending.
+
+    Args:
+        file (Path): Log filename path to process.
+
+    Returns:
+        Arrow IPC filename path of the cleaned events, or None if the log
+          file has no blocked events.
+    """
+    temp_file = Path(data_path / f"{file.name}.csv")
+    clean_file = Path(data_path / f"{file.name}.arrow")
+
+    # Skip log files without complete, blocked event lines, which arrow
+    #  cannot open as a csv stream
+    lines = iter_valid_lines(file)
+    first_line = next(lines, None)
+    if first_line is None:
+        return None
+
+    # Stream the complete lines of the log file as arrow RecordBatches
+    stream = io.BufferedReader(
+        LineStream(itertools.chain([first_line], lines)))
+    reader = pacsv.open_csv(stream,
+                            read_options=raw_read_options,
+                            parse_options=parse_options,
+                            convert_options=raw_convert_options)
+
+    # Delete this file's temp files if it fails part way
+    try:
+        # Process in 4 MiB blocks, appending to one buffered temp file handle
+        with open(temp_file, "wb", buffering=1 << 20) as temp:
+            for batch in reader:
+                chunk = batch.to_pandas()
+
+                # Remove unblocked events and unnecessary columns in one pass
+                df = chunk.loc[chunk["Blocked Source"].to_numpy(), columns]
+
+                # Clean the "Description" column once per unique description
+                descriptions = df["Event Description"].cat.categories
+                cleaned = descriptions.astype("string[pyarrow]").str.replace(
+                    r"^\[.*?\>\s*", "", regex=True)
+                df["Event Description"] = df["Event Description"].map(
+                    dict(zip(descriptions, cleaned)))
+
+                # Drop duplicate lines by their 64-bit row hash
+                hashes = pd.util.hash_pandas_object(df, index=False)
+                df = df.loc[~hashes.duplicated()]
+
+                # Write the processed DataFrame to a CSV file
+                df.to_csv(temp,
+                          index=False,
+                          header=False,
+                          encoding="utf-8",
+                          lineterminator="\n")
+
+        # Remove duplicates across chunks, then sort once
+        if not temp_file.stat().st_size:
+            temp_file.unlink()
+            return None
+        clean_csv(temp_file, clean_file)
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        clean_file.unlink(missing_ok=True)
+        raise
+    return clean_file
+
+
+def merge_files(in_files: list[Path], out_file: Path) -> None:
+    """Merge sorted arrow IPC files into one arrow IPC file sorted by
+    Date/Time decending, and delete the original files.
+
+    The files are concatenated and sorted once, as arrow's sort on the
+    int64 timestamps is faster than a k-way merge of the sorted files.
+    Duplicates across the files are left for purge_old_and_update, which
+    drops every row it has already written.
+
+    Args:
+        in_files (list[Path]): Arrow IPC filename paths to merge.
+        out_file (Path): Arrow IPC filename path of output file.
+
+    Returns:
+        None
+    """
+    sources = [pa.memory_map(str(file)) for file in in_files]
+    table = pa.concat_tables(
+        pa.ipc.open_file(source).read_all() for source in sources)
+
+    # Sort by Date/Time
+    table_sorted = table.sort_by([("Date/Time", "descending")])
+    del table
+
+    # Write merged file
+    with pa.ipc.new_file(out_file, schema) as writer:
+        writer.write_table(table_sorted)
+    del table_sorted
+
+    # Delete merged files
+    for source, file in zip(sources, in_files):
+        source.close()
+        file.unlink()
+
+
 def main() -> None:
     """Do the stuff."""
-    logs = get_logs()
-    files = clean_logs(logs)
-    out_file = Path(data_path / "events.csv")
-    temp_file = Path(data_path / "temp.csv")
-
-    # Define the columns based on the structure of the log
-    raw_columns = [
-        "ID", "Priority", "Type", "Event Description", "Date/Time", "Protocol",
-        "Source IP Address", "Source Port", "Source URL", "Source MAC Address",
-        "Internal Source", "Blocked Source", "Destination IP Address",
-        "Destination Port", "Destination URL", "Destination MAC Address",
-        "Internal Destination", "Blocked Destination", "Bad Host", "Good Host"
-    ]
+    files = get_logs()
+    out_file = Path(data_path / "events.parquet")
+    clean_file = Path(data_path / "temp.arrow")
 
-    # Process each log file
-    for file in files:
-
-        # Read the log file into a DataFrame
-        df = pd.read_csv(file,
-                         header=None,
-                         names=raw_columns,
-                         chunksize=50000,
-                         encoding="utf-8",
-                         dtype=dtypes,
-                         on_bad_lines="skip")
-
-        # Process in 50,000 line chunks
-        for chunk in df:
-
-            # Remove unblocked events
-            df_blocked = chunk[chunk["Blocked Source"]]
-            del chunk
-
-            # Remove unnecessary columns
-            df_columns = df_blocked[columns]
-            del df_blocked
-
-            # Clean the "Description" column
-            df_columns["Event Description"] = df_columns[
-                "Event Description"].apply(
-                    lambda desc: re.sub(r"^\[.*?\>\s*", "", desc))
-
-            # Drop duplicate lines
-            df_dropped = df_columns.drop_duplicates()
-            del df_columns
-
-            # Write the processed DataFrame to a CSV file
-            df_dropped.to_csv(temp_file,
-                              mode="a",
-                              index=False,
-                              header=False,
-                              encoding="utf-8")
-            del df_dropped
-            clean_csv(temp_file, temp_file)
-
-        # Delete copied log files
-        file.unlink(missing_ok=True)
-        print(f"Finished: {file}")
-
-    # Make updated csv file for the dashboard application
-    purge_old_and_update(temp_file, out_file)
+    # Process each log file in its own process, skipping failed files and
+    #  deleting per-file outputs left behind if the run is aborted
+    clean_files = []
+    try:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            futures = [pool.submit(process_one, file) for file in files]
+            for file, future in zip(files, futures):
+                try:
+                    file_clean = future.result()
+                except Exception as error:
+                    print(f"Failed: {file}: {error!r}", file=sys.stderr)
+                    continue
+                if file_clean is not None:
+                    clean_files.append(file_clean)
+                print(f"Finished: {file}")
+
+        # Merge the sorted events of all log files
+        if clean_files:
+            merge_files(clean_files, clean_file)
+    finally:
+        for file_clean in clean_files:
+            file_clean.unlink(missing_ok=True)
+
+    # Make updated event data files for the dashboard application
+    purge_old_and_update(clean_file, out_file)
 
 
 if __name__ == "__main__":
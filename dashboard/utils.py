@@ -2,22 +2,101 @@
 
 from __future__ import annotations
 from typing import Hashable, Any
+import os
+import re
+import bisect
 import pathlib
+import functools
+import duckdb
+import orjson
 import plotly.graph_objects as go
 import plotly.express as px
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from dash import dash_table
 
 # Define APP_PATH as the absolute path of the directory containing this script.
 APP_PATH = str(pathlib.Path(__file__).parent.resolve())
 
-# Open and read the JSON file containing event data into a pandas DataFrame.
+# In-memory DuckDB connection for querying the Parquet event data, or the
+#  csv copy of it when there is none, loaded once per modification.
+EVENTS_FILE = f"{APP_PATH}/data/events.parquet"
+EVENTS_CSV = f"{APP_PATH}/data/events.csv"
+EVENTS_COLUMNS = [
+    "Date/Time", "Source IP Address", "Destination IP Address",
+    "Event Description", "Priority"
+]
+# DataTable filter expressions, "{column} operator value", and the word
+#  operator of each symbol
+FILTER_PATTERN = re.compile(
+    r"\{(?P<name>[^}]*)\}\s*[si]?"
+    r"(?:(?P<word>ge|le|lt|gt|ne|eq|contains|datestartswith)\s"
+    r"|(?P<symbol>>=|<=|!=|<|>|=))\s*(?P<value>.*?)\s*$")
+FILTER_SYMBOLS = {
+    ">=": "ge",
+    "<=": "le",
+    "<": "lt",
+    ">": "gt",
+    "!=": "ne",
+    "=": "eq"
+}
+SQL_OPERATORS = {
+    "eq": "=",
+    "ne": "!=",
+    "lt": "<",
+    "le": "<=",
+    "gt": ">",
+    "ge": ">="
+}
+# Event timestamps are stored as integers and only formatted for display
+EVENTS_QUERY = f"""
+    SELECT strftime("Date/Time", '%Y/%m/%d %H:%M:%S') AS "Date/Time",
+           * EXCLUDE ("Date/Time")
+    FROM read_parquet('{EVENTS_FILE}')
+"""
+db = duckdb.connect(":memory:")
+
+# Threat risk score colors, each used for scores up to its threshold
+SCORE_THRESHOLDS = (0.250, 0.400, 0.500, 0.600, 0.700, 0.800, 0.900)
+SCORE_COLORS = ("darkred", "red", "orangered", "orange", "yellow",
+                "limegreen", "turquoise", "royalblue")
+
+# Margins shared by every figure, and the slice outline of the threat
+#  source and destination pie charts
+FIGURE_MARGIN = {"l": 30, "r": 30, "t": 30, "b": 30}
+SLICE_LINE = {"color": "black", "width": 1}
+
+# Threat source and destination pie chart palettes
+SOURCE_COLORS = list(px.colors.qualitative.Light24_r)
+DESTINATION_COLORS = list(px.colors.qualitative.Dark24)
+
+# Threat risk level legend ring, the same in every risk score graph
+LEGEND_RING = {
+    "type": "pie",
+    "labels": [
+        "Major Risk", "Major Risk ", "Major Risk  ", "Cautionary Risk",
+        "Minor Risk", "Acceptable Risk", "Acceptable Risk ",
+        "Acceptable Risk  "
+    ],
+    "values": [1] * len(SCORE_COLORS),
+    "hole": 1,
+    "textinfo": "none",
+    "hoverinfo": "skip",
+    "sort": False,
+    "marker": {
+        "colors": list(SCORE_COLORS)
+    },
+}
+
+# Open and read the JSON file containing event data into a dictionary.
 # The JSON file is expected to be located in a 'data' subdirectory of APP_PATH.
 try:
-    with open(f"{APP_PATH}/data/events.json", encoding="utf-8") as f:
-        json_data = pd.read_json(f)
+    json_data = orjson.loads(
+        pathlib.Path(f"{APP_PATH}/data/events.json").read_bytes())
 except FileNotFoundError:
-    json_data = pd.DataFrame({
+    json_data = {
         "AWARE Threats": {
             "Count": [],
             "Date": []
@@ -34,7 +113,11 @@ except FileNotFoundError:
             "Count": [],
             "Source": []
         }
-    })
+    }
+
+# Priority counts by priority level, used for the threat risk score
+priority_counts = dict(
+    zip(json_data["Priorities"]["Priority"], json_data["Priorities"]["Count"]))
 
 
 def calculate_score(priorites_dict: dict[str, int]) -> float:
@@ -61,38 +144,27 @@ def calculate_score(priorites_dict: dict[str, int]) -> float:
           function returns 0.0 as a default.
 
     Note:
-    - The function uses a combination of `filter`, `map`, and `sum` to perform
-        calculations in a functional style.
+    - The sums are written out as straight-line arithmetic over the four
+        priority counts.
     - The score calculation is specifically tailored to the use case and
         expects the input dictionary keys to match the defined priorities.
         Keys outside the defined priorities ("0", "1", "2", "3") are ignored
         in the calculation.
     """
-    priorities = {"0", "1", "2", "3"}
-    priotities_total = sum(
-        map(lambda kv: kv[1],
-            filter(lambda kv: kv[0] in priorities, priorites_dict.items())))
-
-    scoring_calc = {
-        "0": float(priotities_total * -.1),
-        "1": 0.25,
-        "2": 0.50,
-        "3": 0.95
-    }
-    n_calc = {"0": float(priotities_total), "1": 25.0, "2": 1.10, "3": 0.95}
-
-    total_value = sum(
-        map(lambda kv: scoring_calc[kv[0]] * kv[1],
-            filter(lambda kv: kv[0] in scoring_calc, priorites_dict.items())))
-    n_value = sum(
-        map(lambda kv: n_calc[kv[0]] * kv[1],
-            filter(lambda kv: kv[0] in n_calc, priorites_dict.items())))
+    get = priorites_dict.get
+    p_0, p_1, p_2, p_3 = get("0", 0), get("1", 0), get("2", 0), get("3", 0)
+    priotities_total = p_0 + p_1 + p_2 + p_3
+
+    total_value = ((priotities_total * -.1) * p_0 + 0.25 * p_1 +
+                   0.50 * p_2 + 0.95 * p_3)
+    n_value = (float(priotities_total) * p_0 + 25.0 * p_1 + 1.10 * p_2 +
+               0.95 * p_3)
     thread_risk_score = (total_value / n_value) if n_value else 0.0
 
-    return round(thread_risk_score, 3) if thread_risk_score >= 0.0 else round(
-        0.0, 3)
+    return round(thread_risk_score, 3) if thread_risk_score >= 0.0 else 0.0
 
 
+@functools.lru_cache(maxsize=1)
 def generate_threat_risk_score_graph() -> go.Figure:
     """Generates a donut chart visualizing the threat risk score and its
     distribution across predefined risk categories.
@@ -116,53 +188,24 @@ def generate_threat_risk_score_graph() -> go.Figure:
           a visual aid.
 
     Note:
-    - The 'json_data' global variable must be pre-defined and structured to
-        include necessary information under "Priorities" for this function
-        to operate correctly.
+    - The 'priority_counts' global variable is built from the "Priorities"
+        data of 'json_data' when it is loaded.
     - The function depends on the 'calculate_score' function to compute the
         threat risk score from priority counts.
-    - Risk levels and their color representation are predefined within the
-        function.
+    - Risk levels and their color representation are predefined by the
+        SCORE_THRESHOLDS and SCORE_COLORS constants.
     - The chart is designed to suppress legends and hover information for
         clarity and focuses solely on the visual representation of the threat
         risk score.
     """
-    priorities = dict(
-        zip(json_data["Priorities"]["Priority"],
-            json_data["Priorities"]["Count"]))
-
-    score = calculate_score(priorities)
+    score = calculate_score(priority_counts)
     remainder = 1 - score
-    score_color = "gainsboro"
-
-    if score <= 0.250:
-        score_color = "darkred"
-    elif 0.250 < score <= 0.400:
-        score_color = "red"
-    elif 0.400 < score <= 0.500:
-        score_color = "orangered"
-    elif 0.500 < score <= 0.600:
-        score_color = "orange"
-    elif 0.600 < score <= 0.700:
-        score_color = "yellow"
-    elif 0.700 < score <= 0.800:
-        score_color = "limegreen"
-    elif 0.800 < score <= 0.900:
-        score_color = "turquoise"
-    elif 0.900 < score:
-        score_color = "royalblue"
-    else:
-        pass
-
-    trs_df = pd.DataFrame({
-        "Label": ["Score", "Remainder", "High Risk", "Low Risk"],
-        "Value": [score, remainder, 0, 0]
-    })
+    score_color = SCORE_COLORS[bisect.bisect_left(SCORE_THRESHOLDS, score)]
 
     fig = go.Figure(data=[
         go.Pie(
-            labels=trs_df["Label"],
-            values=trs_df["Value"],
+            labels=["Score", "Remainder", "High Risk", "Low Risk"],
+            values=[score, remainder, 0, 0],
             hole=.7,
             textinfo="none",
             showlegend=False,
@@ -177,25 +220,7 @@ def generate_threat_risk_score_graph() -> go.Figure:
             },
         )
     ])
-    fig.add_trace(
-        go.Pie(
-            labels=[
-                "Major Risk", "Major Risk ", "Major Risk  ", "Cautionary Risk",
-                "Minor Risk", "Acceptable Risk", "Acceptable Risk ",
-                "Acceptable Risk  "
-            ],
-            values=[1, 1, 1, 1, 1, 1, 1, 1],
-            hole=1,
-            textinfo="none",
-            hoverinfo="skip",
-            sort=False,
-            marker={
-                "colors": [
-                    "darkred", "red", "orangered", "orange", "yellow",
-                    "limegreen", "turquoise", "royalblue"
-                ]
-            },
-        ))
+    fig.add_trace(LEGEND_RING)
     fig.add_annotation(x=0.5,
                        y=0.5,
                        text=f"<b>{score:4.3f}</b>",
@@ -206,10 +231,11 @@ def generate_threat_risk_score_graph() -> go.Figure:
                            "color": score_color,
                        })
 
-    fig.update_layout(margin={"l": 30, "r": 30, "t": 30, "b": 30})
+    fig.update_layout(margin=FIGURE_MARGIN)
     return fig
 
 
+@functools.lru_cache(maxsize=1)
 def generate_threat_priorites_graph() -> go.Figure:
     """Generates a horizontal bar graph representing the distribution of
     threat priorities.
@@ -230,15 +256,16 @@ def generate_threat_priorites_graph() -> go.Figure:
         A Plotly Figure object containing the configured horizontal bar graph.
           The graph emphasizes the distribution of threat priorities by count,
           with customization options applied for visual clarity, including
-          colored bars based on priority level and suppressed y-axis labels
-          for a cleaner presentation.
+          colored bars based on priority level and priority labels on the
+          y-axis.
 
     Note:
     - The 'json_data' global variable must be pre-defined and structured
         correctly with "Priorities" data for the function to execute
         successfully.
     - The graph displays data for the four highest priorities by default, as
-        extracted from the tail end of the sorted 'tp_df' DataFrame.
+        extracted from the tail end of the sorted 'tp_df' DataFrame, drawn
+        as a single bar trace.
     - The function utilizes Plotly's graphing library to create the
         visualization, applying a set of custom styling rules to enhance
         readability and visual appeal.
@@ -252,7 +279,7 @@ def generate_threat_priorites_graph() -> go.Figure:
     tp_df = pd.DataFrame({
         "Priority": json_data["Priorities"]["Priority"],
         "Count": json_data["Priorities"]["Count"]
-    })
+    }).tail(4)
     priority_colors = {
         "0": "red",
         "1": "orange",
@@ -262,24 +289,22 @@ def generate_threat_priorites_graph() -> go.Figure:
         "5": "limegreen"
     }
 
-    fig = go.Figure()
-    for _, row in tp_df.tail(4).iterrows():
-        color = priority_colors.get(row["Priority"], "limegreen")
-        fig.add_trace(
-            go.Bar(
-                x=[row["Count"]],
-                y=[row["Priority"]],
-                orientation="h",
-                marker={"color": color},
-                name=f"Priority {row['Priority']}",
-            ))
+    colors = tp_df["Priority"].map(priority_colors).fillna("limegreen")
+
+    fig = go.Figure(
+        go.Bar(
+            x=tp_df["Count"].tolist(),
+            y=("Priority " + tp_df["Priority"].astype(str)).tolist(),
+            orientation="h",
+            marker={"color": colors.tolist()},
+        ))
     fig.update_xaxes(title_text="Total Number of Events")
-    fig.update_layout(legend={"traceorder": "reversed"})
-    fig.update_layout(margin={"l": 30, "r": 30, "t": 30, "b": 30})
-    fig.update_yaxes(visible=False)
+    fig.update_layout(margin=FIGURE_MARGIN)
+    fig.update_yaxes(automargin=True)
     return fig
 
 
+@functools.lru_cache(maxsize=1)
 def generate_threat_source_graph() -> go.Figure:
     """Generates a Plotly graph object (Figure) representing the distribution
     of threat sources.
@@ -301,30 +326,23 @@ def generate_threat_source_graph() -> go.Figure:
     - The colors for the pie chart are defined using Plotly Express's
         qualitative Light24_r color scale for visual distinction.
     """
-    ts_df = pd.DataFrame({
-        "Source": json_data["Threat Sources"]["Source"],
-        "Count": json_data["Threat Sources"]["Count"]
-    })
-
     fig = go.Figure(data=[
         go.Pie(
-            labels=ts_df["Source"],
-            values=ts_df["Count"],
+            labels=json_data["Threat Sources"]["Source"],
+            values=json_data["Threat Sources"]["Count"],
             hole=.7,
             textinfo="none",
             marker={
-                "colors": px.colors.qualitative.Light24_r,
-                "line": {
-                    "color": "black",
-                    "width": 1
-                }
+                "colors": SOURCE_COLORS,
+                "line": SLICE_LINE
             },
         )
     ])
-    fig.update_layout(margin={"l": 30, "r": 30, "t": 30, "b": 30})
+    fig.update_layout(margin=FIGURE_MARGIN)
     return fig
 
 
+@functools.lru_cache(maxsize=1)
 def generate_threat_destination_graph() -> go.Figure:
     """Generates a Plotly graph object (Figure) representing the distribution
     of threat destinations.
@@ -349,32 +367,23 @@ def generate_threat_destination_graph() -> go.Figure:
     - The visualization uses Plotly Express's qualitative Dark24 color scale
         to ensure slices are distinct and visually appealing.
     """
-    td_df = pd.DataFrame({
-        "Destination":
-        json_data["Threat Destinations"]["Destination"],
-        "Count":
-        json_data["Threat Destinations"]["Count"]
-    })
-
     fig = go.Figure(data=[
         go.Pie(
-            labels=td_df["Destination"],
-            values=td_df["Count"],
+            labels=json_data["Threat Destinations"]["Destination"],
+            values=json_data["Threat Destinations"]["Count"],
             hole=.7,
             textinfo="none",
             marker={
-                "colors": px.colors.qualitative.Dark24,
-                "line": {
-                    "color": "black",
-                    "width": 1
-                }
+                "colors": DESTINATION_COLORS,
+                "line": SLICE_LINE
             },
         )
     ])
-    fig.update_layout(margin={"l": 30, "r": 30, "t": 30, "b": 30})
+    fig.update_layout(margin=FIGURE_MARGIN)
     return fig
 
 
+@functools.lru_cache(maxsize=1)
 def generate_aware_threats_over_time_graph() -> go.Figure:
     """Generates a Plotly graph object representing AWARE threats over time.
 
@@ -419,7 +428,7 @@ def generate_aware_threats_over_time_graph() -> go.Figure:
     fig.update_yaxes(title_text="Number of Events")
     fig.update_xaxes(title_text="Timestamp per 12 Hours")
 
-    fig.update_layout(margin={"l": 30, "r": 30, "t": 30, "b": 30})
+    fig.update_layout(margin=FIGURE_MARGIN)
     return fig
 
 
@@ -454,6 +463,27 @@ def generate_threat_locations_map() -> go.Figure:
         portion of the range of counts present in the data.
     - The function assumes the presence of a global variable 'APP_PATH' that
         specifies the base directory path for locating the CSV file.
+    - The figure is cached until the CSV file is modified, so callers must
+        not modify the returned figure.
+    """
+    try:
+        mtime = os.path.getmtime(f"{APP_PATH}/data/locations.csv")
+    except FileNotFoundError:
+        mtime = 0.0
+    return cached_threat_locations_map(mtime)
+
+
+@functools.lru_cache(maxsize=1)
+def cached_threat_locations_map(mtime: float) -> go.Figure:
+    """Generates the threat locations map, rebuilding it only when the
+    location data changes.
+
+    Args:
+        mtime (float): Modification time of the CSV file, used as the cache
+          key, or 0.0 if the file does not exist.
+
+    Returns:
+        A Plotly Figure object containing a Scattergeo plot.
     """
     try:
         tl_df = pd.read_csv(f"{APP_PATH}/data/locations.csv")
@@ -466,8 +496,10 @@ def generate_threat_locations_map() -> go.Figure:
             "Lon": [0.0]
         })
 
-    tl_df["text"] = tl_df["City Name"] + ", " + tl_df[
-        "Country Name"] + "<br>Count: " + (tl_df["Count"]).astype(str)
+    tl_df["text"] = [
+        f"{city}, {country}<br>Count: {count}" for city, country, count in
+        zip(tl_df["City Name"], tl_df["Country Name"], tl_df["Count"])
+    ]
     colors = ["yellow", "orange", "orangered", "red", "darkred"]
     max_count = max(tl_df["Count"])
     step = max_count // len(colors)
@@ -476,17 +508,28 @@ def generate_threat_locations_map() -> go.Figure:
               for i in range(len(colors))]
     scale = 2500
 
+    # Assign each location to its count range in one pass
+    counts = tl_df["Count"].to_numpy()
+    sizes = counts.astype(np.float32) / scale
+    lon = tl_df["Lon"].to_numpy()
+    lat = tl_df["Lat"].to_numpy()
+    text = tl_df["text"].to_numpy()
+    if step:
+        bins = np.clip((counts - 1) // step, 0, len(colors) - 1)
+    else:
+        bins = np.full(counts.size, len(colors) - 1)
+    bins[counts < 1] = -1
+
     fig = go.Figure()
     for c, lim in enumerate(limits):
-        tl_df_sub = tl_df[(tl_df['Count'] >= lim[0])
-                          & (tl_df['Count'] <= lim[1])]
+        mask = bins == c
         fig.add_trace(
             go.Scattergeo(locationmode="ISO-3",
-                          lon=tl_df_sub["Lon"],
-                          lat=tl_df_sub["Lat"],
-                          text=tl_df_sub["text"],
+                          lon=lon[mask],
+                          lat=lat[mask],
+                          text=text[mask],
                           marker={
-                              "size": tl_df_sub["Count"] / scale,
+                              "size": sizes[mask],
                               "color": colors[c],
                               "line_color": "rgb(40, 40, 40)",
                               "line_width": 0.5,
@@ -503,8 +546,8 @@ def generate_threat_locations_map() -> go.Figure:
             "showsubunits": True,
             "landcolor": "rgb(30, 30, 30)"
         },
+        margin=FIGURE_MARGIN,
     )
-    fig.update_layout(margin={"l": 30, "r": 30, "t": 30, "b": 30})
     return fig
 
 
@@ -613,28 +656,41 @@ def split_filter_part(filter_part: str) -> tuple[str, str, str] | list[None]:
           and the value as a string. If the filter_part cannot be parsed,
           returns a list containing three None values.
     """
-    operators = [["ge ", ">="], ["le ", "<="], ["lt ", "<"], ["gt ", ">"],
-                 ["ne ", "!="], ["eq ", "="], ["contains "],
-                 ["datestartswith "]]
-
-    value: str | float
-    for operator_type in operators:
-        for operator in operator_type:
-            if operator in filter_part:
-                name_part, value_part = filter_part.split(operator, 1)
-                name = name_part[name_part.find("{") + 1:name_part.rfind("}")]
-                value_part = value_part.strip()
-                v0 = value_part[0]
-                if (v0 == value_part[-1] and v0 in ("'", '"', '`')):
-                    value = value_part[1:-1].replace("\\" + v0, v0)
-                else:
-                    try:
-                        value = str(value_part)
-                    except ValueError:
-                        value = value_part
-                return name, operator_type[0].strip(), value
+    match = FILTER_PATTERN.search(filter_part)
+    if not match:
+        return [None] * 3
+
+    operator = match["word"] or FILTER_SYMBOLS[match["symbol"]]
+    value = match["value"]
+    quote = value[:1]
+    if quote in ("'", '"', "`") and len(value) > 1 and value[-1] == quote:
+        value = value[1:-1].replace("\\" + quote, quote)
+    return match["name"], operator, value
 
-    return [None] * 3
+
+@functools.lru_cache(maxsize=1)
+def load_events(path: str, mtime: float) -> pa.Table:
+    """Loads the event data with its dates formatted for display, reading
+    the file again only when it changes.
+
+    Args:
+        path (str): Path of the Parquet file, or of its csv copy, which is
+          read with Arrow's multithreaded csv reader.
+        mtime (float): Modification time of the file, used as the cache key.
+
+    Returns:
+        An Arrow Table of the event data, sorted by Date/Time descending.
+    """
+    if path == EVENTS_CSV:
+        return pacsv.read_csv(
+            path,
+            read_options=pacsv.ReadOptions(column_names=EVENTS_COLUMNS),
+            convert_options=pacsv.ConvertOptions(column_types={
+                "Date/Time": pa.string(),
+                "Priority": pa.int32()
+            })).sort_by([("Date/Time", "descending")])
+    with db.cursor() as cursor:
+        return cursor.sql(EVENTS_QUERY).fetch_arrow_table()
 
 
 def filter_logic(page_current: int, page_size: int, sort_by: list[dict[str,
@@ -644,10 +700,10 @@ def filter_logic(page_current: int, page_size: int, sort_by: list[dict[str,
     criteria, returning the filtered and sorted dataset as a list of
     dictionaries for a specified page of results.
 
-    This function reads data from a CSV file, applies filtering based on a
-    filter string, sorts the filtered results if sorting criteria are provided,
-    and paginates the results based on the current page and page size
-    parameters.
+    This function translates the filter string and sorting criteria into a
+    single DuckDB query over the Parquet event data, so filtering, sorting,
+    and pagination run in the query engine and only the current page of
+    records is materialized.
 
     Args:
         page_current (int): The current page number (0-indexed) for pagination.
@@ -665,50 +721,71 @@ def filter_logic(page_current: int, page_size: int, sort_by: list[dict[str,
           record in the dataset.
     """
     filtering_expressions = t_filter.split(" && ")
-    columns = [
-        "Date/Time", "Source IP Address", "Destination IP Address",
-        "Event Description", "Priority"
-    ]
-    dtypes = {
-        "Date/Time": str,
-        "Source IP Address": str,
-        "Destination IP Address": str,
-        "Event Description": str,
-        "Priority": int,
-    }
-
-    try:
-        df = pd.read_csv(f"{str(APP_PATH)}/data/events.csv",
-                         header=None,
-                         encoding="utf-8",
-                         names=columns,
-                         dtype=dtypes)
-        df.sort_values(by=["Date/Time"], inplace=True, ascending=False)
-    except FileNotFoundError:
-        df = pd.DataFrame()
+    conditions = []
+    params: list[Any] = []
 
     for filter_part in filtering_expressions:
         case_sensitive = "scontains" in filter_part
         col_name, operator, filter_value = split_filter_part(filter_part)
-        if col_name and operator and filter_value:
-            if operator in ("eq", "ne", "lt", "le", "gt", "ge"):
-                df = df.loc[getattr(df[col_name], operator)(filter_value)]
-            elif operator == "contains":
+        if col_name in EVENTS_COLUMNS and operator and filter_value:
+            column = f'"{col_name}"'
+            param: str | int = filter_value
+            if operator in SQL_OPERATORS and col_name == "Priority":
+                try:
+                    param = int(filter_value)
+                except ValueError:
+                    continue
+                conditions.append(f"{column} {SQL_OPERATORS[operator]} ?")
+            elif operator in SQL_OPERATORS:
+                conditions.append(f"{column} {SQL_OPERATORS[operator]} ?")
+            elif operator == "contains" and col_name == "Priority":
                 if filter_value.isdigit():
-                    df = df.loc[df[col_name].astype(str).str.contains(
-                        filter_value)]
+                    conditions.append(f"{column} = ?")
+                    param = int(filter_value)
                 else:
-                    df = df.loc[df[col_name].str.contains(filter_value,
-                                                          case=case_sensitive)]
+                    conditions.append(
+                        f"contains(CAST({column} AS VARCHAR), ?)")
+            elif operator == "contains" and case_sensitive:
+                conditions.append(f"contains({column}, ?)")
+            elif operator == "contains":
+                conditions.append(f"contains(lower({column}), ?)")
+                param = filter_value.lower()
             elif operator == "datestartswith":
-                df = df.loc[df[col_name].str.startswith(filter_value)]
-
-    if len(sort_by):
-        df = df.sort_values(
-            [col["column_id"] for col in sort_by],
-            ascending=[col["direction"] == "asc" for col in sort_by],
-            inplace=False)
+                conditions.append(f"starts_with({column}, ?)")
+            else:
+                continue
+            params.append(param)
+
+    order = []
+    for col in sort_by:
+        if col["column_id"] in EVENTS_COLUMNS:
+            direction = "ASC" if col["direction"] == "asc" else "DESC"
+            order.append(f'"{col["column_id"]}" {direction}')
+
+    # The event data is loaded sorted by Date/Time descending, so only
+    #  other sort orders need an ORDER BY
+    order_by = ""
+    if order and order != ['"Date/Time" DESC']:
+        order.append('"Date/Time" DESC')
+        order_by = f"ORDER BY {', '.join(order)}"
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    query = f"SELECT * FROM events {where} {order_by} LIMIT ? OFFSET ?"
+    params += [page_size, page_current * page_size]
+
+    for path in (EVENTS_FILE, EVENTS_CSV):
+        try:
+            events = load_events(path, os.path.getmtime(path))
+            break
+        except FileNotFoundError:
+            continue
+        except (duckdb.IOException, pa.ArrowInvalid):
+            return []
+    else:
+        return []
 
-    page = page_current
-    size = page_size
-    return df.iloc[page * size:(page + 1) * size].to_dict("records")
+    with db.cursor() as cursor:
+        cursor.register("events", events)
+        cursor.execute(query, params)
+        names = [column[0] for column in cursor.description]
+        return [dict(zip(names, row)) for row in cursor.fetchall()]